@@ -1,4 +1,7 @@
+import importlib
 import os
+import typing
+from typing import Any
 
 # isort: off
 
@@ -6,15 +9,16 @@ import rl_zoo3.gym_patches  # noqa: F401
 
 # isort: on
 
-from rl_zoo3.utils import (
-    ALGOS,
-    create_test_env,
-    get_latest_run_id,
-    get_saved_hyperparams,
-    get_trained_models,
-    get_wrapper_class,
-    linear_schedule,
-)
+if typing.TYPE_CHECKING:
+    from rl_zoo3.utils import (
+        ALGOS,
+        create_test_env,
+        get_latest_run_id,
+        get_saved_hyperparams,
+        get_trained_models,
+        get_wrapper_class,
+        linear_schedule,
+    )
 
 # Read version from file
 version_file = os.path.join(os.path.dirname(__file__), "version.txt")
@@ -30,3 +34,16 @@ __all__ = [
     "get_wrapper_class",
     "linear_schedule",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy import of `rl_zoo3.utils` (which pulls SB3 and PyTorch)
+    # so that reading `__version__` or importing a submodule stays cheap
+    if name == "utils":
+        # Keep `import rl_zoo3; rl_zoo3.utils` working
+        return importlib.import_module("rl_zoo3.utils")
+    if name in __all__:
+        value = getattr(importlib.import_module("rl_zoo3.utils"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
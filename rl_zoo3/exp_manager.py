@@ -49,7 +49,15 @@ from torch import nn as nn
 import rl_zoo3.import_envs  # noqa: F401
 from rl_zoo3.callbacks import SaveVecNormalizeCallback, TrialEvalCallback
 from rl_zoo3.hyperparams_opt import HYPERPARAMS_SAMPLER
-from rl_zoo3.utils import ALGOS, get_callback_list, get_class_by_name, get_latest_run_id, get_wrapper_class, linear_schedule
+from rl_zoo3.utils import (
+    ALGOS,
+    SafeLoader,
+    get_callback_list,
+    get_class_by_name,
+    get_latest_run_id,
+    get_wrapper_class,
+    linear_schedule,
+)
 
 
 class ExperimentManager:
@@ -296,7 +304,7 @@ class ExperimentManager:
         if self.config.endswith(".yml") or self.config.endswith(".yaml"):
             # Load hyperparameters from yaml file
             with open(self.config) as f:
-                hyperparams_dict = yaml.safe_load(f)
+                hyperparams_dict = yaml.load(f, Loader=SafeLoader)
         elif self.config.endswith(".py"):
             global_variables: Dict = {}
             # Load hyperparameters from python file
@@ -901,7 +909,7 @@ class ExperimentManager:
 
         # Save python object to inspect/re-use it later
         with open(f"{log_path}.pkl", "wb+") as f:
-            pkl.dump(study, f)
+            pkl.dump(study, f, protocol=pkl.HIGHEST_PROTOCOL)
 
         # Skip plots
         if self.no_optim_plots:
@@ -239,7 +239,7 @@ def all_plots():  # noqa: C901
     if args.output is not None:
         print(f"Saving to {args.output}.pkl")
         with open(f"{args.output}.pkl", "wb") as file_handler:
-            pickle.dump(post_processed_results, file_handler)
+            pickle.dump(post_processed_results, file_handler, protocol=pickle.HIGHEST_PROTOCOL)
 
     if not args.no_display:
         plt.show()
@@ -22,7 +22,7 @@ from wasabi import Printer
 import rl_zoo3.import_envs  # noqa: F401 pylint: disable=unused-import
 from rl_zoo3 import ALGOS, get_saved_hyperparams
 from rl_zoo3.exp_manager import ExperimentManager
-from rl_zoo3.utils import StoreDict, create_test_env, get_model_path
+from rl_zoo3.utils import StoreDict, UnsafeLoader, create_test_env, get_model_path
 
 msg = Printer()
 
@@ -354,7 +354,7 @@ if __name__ == "__main__":
     args_path = os.path.join(log_path, env_name, "args.yml")
     if os.path.isfile(args_path):
         with open(args_path) as f:
-            loaded_args = yaml.load(f, Loader=yaml.UnsafeLoader)
+            loaded_args = yaml.load(f, Loader=UnsafeLoader)
             if loaded_args["env_kwargs"] is not None:
                 env_kwargs = loaded_args["env_kwargs"]
 
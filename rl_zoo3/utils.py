@@ -23,6 +23,13 @@ from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv, VecEnv,
 # For custom activation fn
 from torch import nn as nn
 
+try:
+    # Use libyaml bindings when available, much faster than the pure Python loader
+    from yaml import CSafeLoader as SafeLoader
+    from yaml import CUnsafeLoader as UnsafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader, UnsafeLoader  # type: ignore[assignment]
+
 ALGOS: Dict[str, Type[BaseAlgorithm]] = {
     "a2c": A2C,
     "ddpg": DDPG,
@@ -304,15 +311,18 @@ def get_trained_models(log_folder: str) -> Dict[str, Tuple[str, str]]:
     :return: Dict representing the trained agents
     """
     trained_models = {}
-    for algo in os.listdir(log_folder):
-        if not os.path.isdir(os.path.join(log_folder, algo)):
-            continue
-        for model_folder in os.listdir(os.path.join(log_folder, algo)):
-            args_files = glob.glob(os.path.join(log_folder, algo, model_folder, "*/args.yml"))
+    with os.scandir(log_folder) as entries:
+        algo_folders = [entry for entry in entries if entry.is_dir()]
+    for algo_folder in algo_folders:
+        algo = algo_folder.name
+        with os.scandir(algo_folder.path) as entries:
+            model_folders = [entry.path for entry in entries if entry.is_dir()]
+        for model_folder in model_folders:
+            args_files = glob.glob(os.path.join(model_folder, "*/args.yml"))
             if len(args_files) != 1:
                 continue  # we expect only one sub-folder with an args.yml file
             with open(args_files[0]) as fh:
-                env_id = yaml.load(fh, Loader=yaml.UnsafeLoader)["env"]
+                env_id = yaml.load(fh, Loader=UnsafeLoader)["env"]
 
             model_name = ModelName(algo, EnvironmentName(env_id))
             trained_models[model_name] = (algo, env_id)
@@ -399,7 +409,7 @@ def get_saved_hyperparams(
         if os.path.isfile(config_file):
             # Load saved hyperparameters
             with open(os.path.join(stats_path, "config.yml")) as f:
-                hyperparams = yaml.load(f, Loader=yaml.UnsafeLoader)
+                hyperparams = yaml.load(f, Loader=UnsafeLoader)
             hyperparams["normalize"] = hyperparams.get("normalize", False)
         else:
             obs_rms_path = os.path.join(stats_path, "obs_rms.pkl")
@@ -0,0 +1,34 @@
+import subprocess
+
+
+def _assert_eq(left, right):
+    assert left == right, f"{left} != {right}"
+
+
+CHECK_LAZY_IMPORT = """
+import sys
+
+import rl_zoo3
+
+assert rl_zoo3.__version__
+assert "torch" not in sys.modules, "torch imported by `import rl_zoo3`"
+assert "stable_baselines3" not in sys.modules, "stable_baselines3 imported by `import rl_zoo3`"
+
+from rl_zoo3 import ALGOS
+
+assert "ppo" in ALGOS
+assert rl_zoo3.utils.get_model_path is not None
+
+try:
+    rl_zoo3.unknown_attribute
+except AttributeError:
+    pass
+else:
+    raise AssertionError("Expected AttributeError")
+"""
+
+
+def test_lazy_import():
+    # Run in a separate process so modules imported by other tests don't interfere
+    return_code = subprocess.call(["python", "-c", CHECK_LAZY_IMPORT])
+    _assert_eq(return_code, 0)